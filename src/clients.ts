@@ -1,5 +1,5 @@
-import { readFile } from "node:fs/promises";
-import { basename, resolve as resolvePath } from "node:path";
+import { openAsBlob } from "node:fs";
+import { basename, extname, resolve as resolvePath } from "node:path";
 
 import { AppConfig } from "./config.js";
 
@@ -22,8 +22,8 @@ export class ApiError extends Error {
   }
 }
 
-function buildUrl(baseUrl: string, path: string, query?: Record<string, QueryValue>) {
-  const url = new URL(path, `${baseUrl}/`);
+function buildUrl(baseUrl: URL, path: string, query?: Record<string, QueryValue>) {
+  const url = new URL(path, baseUrl);
   if (query) {
     for (const [key, value] of Object.entries(query)) {
       if (value === undefined || value === null || value === "") {
@@ -36,15 +36,7 @@ function buildUrl(baseUrl: string, path: string, query?: Record<string, QueryVal
 }
 
 async function parseJson(response: Response): Promise<unknown> {
-  const text = await response.text();
-  if (!text) {
-    return null;
-  }
-  try {
-    return JSON.parse(text) as unknown;
-  } catch {
-    return text;
-  }
+  return parsePossibleJson(await response.text());
 }
 
 function normalizeEnvelope(payload: unknown): unknown {
@@ -58,10 +50,15 @@ function normalizeEnvelope(payload: unknown): unknown {
   return payload;
 }
 
+const JSON_VALUE_START = /^\s*[{["\-0-9tfn]/;
+
 function parsePossibleJson(text: string): unknown {
   if (!text) {
     return null;
   }
+  if (!JSON_VALUE_START.test(text)) {
+    return text;
+  }
   try {
     return JSON.parse(text) as unknown;
   } catch {
@@ -70,7 +67,7 @@ function parsePossibleJson(text: string): unknown {
 }
 
 function parseSseBlock(block: string): GatewaySseEvent | null {
-  const lines = block.split(/\r?\n/);
+  const lines = block.split("\n");
   let id: string | undefined;
   let event: string | undefined;
   const dataLines: string[] = [];
@@ -107,6 +104,76 @@ function parseSseBlock(block: string): GatewaySseEvent | null {
   };
 }
 
+const UPLOAD_MIME_TYPES: Record<string, string> = {
+  ".zip": "application/zip",
+  ".json": "application/json",
+  ".txt": "text/plain",
+  ".png": "image/png",
+  ".jpg": "image/jpeg",
+  ".jpeg": "image/jpeg",
+  ".gif": "image/gif",
+  ".webp": "image/webp",
+  ".mp3": "audio/mpeg",
+  ".wav": "audio/wav",
+  ".mp4": "video/mp4",
+  ".pdf": "application/pdf",
+};
+
+const SSE_LINE_BREAK = /\r\n?/g;
+
+export class SseParser {
+  private buffer = "";
+  private pendingCarriageReturn = false;
+
+  push(text: string): GatewaySseEvent[] {
+    let chunk = this.pendingCarriageReturn ? `\r${text}` : text;
+    this.pendingCarriageReturn = chunk.endsWith("\r");
+    if (this.pendingCarriageReturn) {
+      // Hold a trailing CR back until we know whether it starts a CRLF pair.
+      chunk = chunk.slice(0, -1);
+    }
+    if (chunk.includes("\r")) {
+      chunk = chunk.replace(SSE_LINE_BREAK, "\n");
+    }
+
+    const scanFrom = Math.max(0, this.buffer.length - 1);
+    this.buffer += chunk;
+    const events: GatewaySseEvent[] = [];
+    let start = 0;
+    let separatorIndex = this.buffer.indexOf("\n\n", scanFrom);
+    while (separatorIndex !== -1) {
+      const event = parseSseBlock(this.buffer.slice(start, separatorIndex));
+      if (event) {
+        events.push(event);
+      }
+      start = separatorIndex + 2;
+      separatorIndex = this.buffer.indexOf("\n\n", start);
+    }
+    if (start > 0) {
+      this.buffer = this.buffer.slice(start);
+    }
+    return events;
+  }
+
+  flush(): GatewaySseEvent | null {
+    const block = this.buffer.trim();
+    this.buffer = "";
+    this.pendingCarriageReturn = false;
+    return parseSseBlock(block);
+  }
+}
+
+function toApiError(response: Response, payload: unknown): ApiError {
+  const message =
+    typeof payload === "object" && payload && "error" in payload
+      ? String(
+          ((payload as Record<string, unknown>).error as Record<string, unknown>)?.message ??
+            response.statusText,
+        )
+      : response.statusText;
+  return new ApiError(message, response.status, payload);
+}
+
 async function requestJson(
   url: URL,
   init: RequestInit,
@@ -118,11 +185,7 @@ async function requestJson(
     const response = await fetch(url, { ...init, signal: controller.signal });
     const payload = await parseJson(response);
     if (!response.ok) {
-      const message =
-        typeof payload === "object" && payload && "error" in payload
-          ? String(((payload as Record<string, unknown>).error as Record<string, unknown>)?.message ?? response.statusText)
-          : response.statusText;
-      throw new ApiError(message, response.status, payload);
+      throw toApiError(response, payload);
     }
     if (
       typeof payload === "object" &&
@@ -151,15 +214,7 @@ async function requestBuffer(
   try {
     const response = await fetch(url, { ...init, signal: controller.signal });
     if (!response.ok) {
-      const payload = await parseJson(response);
-      const message =
-        typeof payload === "object" && payload && "error" in payload
-          ? String(
-              ((payload as Record<string, unknown>).error as Record<string, unknown>)
-                ?.message ?? response.statusText,
-            )
-          : response.statusText;
-      throw new ApiError(message, response.status, payload);
+      throw toApiError(response, await parseJson(response));
     }
     const arrayBuffer = await response.arrayBuffer();
     return Buffer.from(arrayBuffer);
@@ -169,7 +224,18 @@ async function requestBuffer(
 }
 
 export class GatewayClient {
-  constructor(private readonly config: AppConfig) {}
+  private readonly baseUrl: URL;
+  // Joined and cached GETs hand every caller the same object; treat results as read-only.
+  private readonly inflightGets = new Map<string, Promise<unknown>>();
+  private readonly responseCache = new Map<string, { expiresAt: number; value: unknown }>();
+  private writeGeneration = 0;
+
+  private readonly authorization: string;
+
+  constructor(private readonly config: AppConfig) {
+    this.baseUrl = new URL(`${config.gatewayUrl}/`);
+    this.authorization = `Bearer ${config.gatewayToken}`;
+  }
 
   async request(
     method: string,
@@ -178,25 +244,83 @@ export class GatewayClient {
       query?: Record<string, QueryValue>;
       body?: unknown;
       headers?: Record<string, string>;
+      cacheTtlMs?: number;
     } = {},
   ): Promise<unknown> {
-    const url = buildUrl(this.config.gatewayUrl, path, options.query);
+    const url = buildUrl(this.baseUrl, path, options.query);
+    if (method !== "GET") {
+      return this.write(() => this.send(method, url, options));
+    }
+    if (options.body || options.headers) {
+      return this.send(method, url, options);
+    }
+
+    const key = url.href;
+    const cacheTtlMs = options.cacheTtlMs ?? 0;
+    if (cacheTtlMs > 0) {
+      const cached = this.responseCache.get(key);
+      if (cached && cached.expiresAt > performance.now()) {
+        return cached.value;
+      }
+    }
+    const pending = this.inflightGets.get(key);
+    if (pending) {
+      return pending;
+    }
+    const generation = this.writeGeneration;
+    const promise = this.send(method, url, options)
+      .then((value) => {
+        // A write that overlapped this GET may have changed the answer.
+        if (cacheTtlMs > 0 && generation === this.writeGeneration) {
+          this.responseCache.set(key, { expiresAt: performance.now() + cacheTtlMs, value });
+        }
+        return value;
+      })
+      .finally(() => {
+        if (this.inflightGets.get(key) === promise) {
+          this.inflightGets.delete(key);
+        }
+      });
+    this.inflightGets.set(key, promise);
+    return promise;
+  }
+
+  private write<T>(run: () => Promise<T>): Promise<T> {
+    this.invalidateReads();
+    return run().finally(() => this.invalidateReads());
+  }
+
+  private invalidateReads() {
+    this.writeGeneration += 1;
+    this.responseCache.clear();
+    this.inflightGets.clear();
+  }
+
+  private send(
+    method: string,
+    url: URL,
+    options: { body?: unknown; headers?: Record<string, string> },
+  ): Promise<unknown> {
     return requestJson(
       url,
       {
         method,
-        headers: {
-          Authorization: `Bearer ${this.config.gatewayToken}`,
-          ...(options.body ? { "Content-Type": "application/json" } : {}),
-          ...(options.headers ?? {}),
-        },
+        headers: options.headers
+          ? { ...this.jsonHeaders(options.body), ...options.headers }
+          : this.jsonHeaders(options.body),
         body: options.body ? JSON.stringify(options.body) : undefined,
       },
       this.config.gatewayTimeout,
     );
   }
 
-  async stream(
+  private jsonHeaders(body: unknown): Record<string, string> {
+    return body
+      ? { Authorization: this.authorization, "Content-Type": "application/json" }
+      : { Authorization: this.authorization };
+  }
+
+  async *events(
     method: string,
     path: string,
     options: {
@@ -205,20 +329,20 @@ export class GatewayClient {
       headers?: Record<string, string>;
       timeoutMs?: number;
     } = {},
-  ): Promise<GatewaySseEvent[]> {
-    const url = buildUrl(this.config.gatewayUrl, path, options.query);
+  ): AsyncGenerator<GatewaySseEvent> {
+    const url = buildUrl(this.baseUrl, path, options.query);
     const controller = new AbortController();
     const timer = setTimeout(
       () => controller.abort(),
       options.timeoutMs ?? this.config.gatewayTimeout,
     );
-    const events: GatewaySseEvent[] = [];
     try {
       const response = await fetch(url, {
         method,
         headers: {
-          Authorization: `Bearer ${this.config.gatewayToken}`,
+          Authorization: this.authorization,
           Accept: "text/event-stream",
+          "Cache-Control": "no-cache",
           ...(options.body ? { "Content-Type": "application/json" } : {}),
           ...(options.headers ?? {}),
         },
@@ -226,54 +350,36 @@ export class GatewayClient {
         signal: controller.signal,
       });
       if (!response.ok) {
-        const payload = await parseJson(response);
-        const message =
-          typeof payload === "object" && payload && "error" in payload
-            ? String(
-                ((payload as Record<string, unknown>).error as Record<string, unknown>)
-                  ?.message ?? response.statusText,
-              )
-            : response.statusText;
-        throw new ApiError(message, response.status, payload);
+        throw toApiError(response, await parseJson(response));
       }
       if (!response.body) {
-        return events;
+        return;
       }
 
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
-      let buffer = "";
+      const parser = new SseParser();
       while (true) {
         const { done, value } = await reader.read();
-        buffer += decoder.decode(value ?? new Uint8Array(), { stream: !done });
-
-        let separatorMatch = buffer.match(/\r?\n\r?\n/);
-        while (separatorMatch?.index !== undefined) {
-          const splitIndex = separatorMatch.index;
-          const block = buffer.slice(0, splitIndex);
-          buffer = buffer.slice(splitIndex + separatorMatch[0].length);
-          const event = parseSseBlock(block);
-          if (event) {
-            events.push(event);
-          }
-          separatorMatch = buffer.match(/\r?\n\r?\n/);
-        }
+        yield* parser.push(decoder.decode(value ?? new Uint8Array(), { stream: !done }));
 
         if (done) {
-          const finalEvent = parseSseBlock(buffer.trim());
+          const finalEvent = parser.flush();
           if (finalEvent) {
-            events.push(finalEvent);
+            yield finalEvent;
           }
-          return events;
+          return;
         }
       }
     } catch (error) {
       if (controller.signal.aborted && error instanceof Error && error.name === "AbortError") {
-        return events;
+        return;
       }
       throw error;
     } finally {
       clearTimeout(timer);
+      // Releases the connection when the consumer stops iterating early.
+      controller.abort();
     }
   }
 
@@ -285,13 +391,13 @@ export class GatewayClient {
       timeoutMs?: number;
     } = {},
   ): Promise<Buffer> {
-    const url = buildUrl(this.config.gatewayUrl, path, options.query);
+    const url = buildUrl(this.baseUrl, path, options.query);
     return requestBuffer(
       url,
       {
         method: "GET",
         headers: {
-          Authorization: `Bearer ${this.config.gatewayToken}`,
+          Authorization: this.authorization,
           ...(options.headers ?? {}),
         },
       },
@@ -308,28 +414,29 @@ export class GatewayClient {
       extraFields?: Record<string, string>;
     } = {},
   ): Promise<unknown> {
-    const url = buildUrl(this.config.gatewayUrl, path, options.query);
+    const url = buildUrl(this.baseUrl, path, options.query);
     const targetPath = resolvePath(filePath);
-    const fileBuffer = await readFile(targetPath);
+    const file = await openAsBlob(targetPath, {
+      type: UPLOAD_MIME_TYPES[extname(targetPath).toLowerCase()] ?? "application/octet-stream",
+    });
     const form = new FormData();
-    form.append(
-      options.fieldName ?? "file",
-      new File([fileBuffer], basename(targetPath)),
-    );
+    form.append(options.fieldName ?? "file", file, basename(targetPath));
     for (const [key, value] of Object.entries(options.extraFields ?? {})) {
       form.append(key, value);
     }
 
-    return requestJson(
-      url,
-      {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${this.config.gatewayToken}`,
+    return this.write(() =>
+      requestJson(
+        url,
+        {
+          method: "POST",
+          headers: {
+            Authorization: this.authorization,
+          },
+          body: form,
         },
-        body: form,
-      },
-      this.config.gatewayTimeout,
+        this.config.gatewayTimeout,
+      ),
     );
   }
 }
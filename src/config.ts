@@ -2,13 +2,14 @@ export type CapabilityMode = "search" | "readonly" | "minimize" | "full";
 export type LogView = "compact" | "raw";
 
 export interface AppConfig {
-  gatewayUrl: string;
-  gatewayToken: string;
-  gatewayTimeout: number;
-  capabilityMode: CapabilityMode;
-  enableSearchTools: boolean;
-  logView: LogView;
-  enableLogNoiseFiltering: boolean;
+  readonly gatewayUrl: string;
+  readonly gatewayToken: string;
+  readonly gatewayTimeout: number;
+  readonly capabilityMode: CapabilityMode;
+  readonly enableSearchTools: boolean;
+  readonly logView: LogView;
+  readonly enableLogNoiseFiltering: boolean;
+  readonly githubAcceleration: string | null;
 }
 
 const CAPABILITY_MODES = new Set<CapabilityMode>([
@@ -20,21 +21,36 @@ const CAPABILITY_MODES = new Set<CapabilityMode>([
 
 const LOG_VIEWS = new Set<LogView>(["compact", "raw"]);
 
-function env(name: string): string | null {
-  const value = process.env[name]?.trim();
+export const GITHUB_ACCELERATION_DISABLE_VALUES = new Set([
+  "0",
+  "false",
+  "no",
+  "none",
+  "off",
+  "direct",
+  "disable",
+  "disabled",
+]);
+
+type EnvSource = Record<string, string | undefined>;
+
+const FALSE_VALUES = new Set(["0", "false", "no", "off"]);
+
+function env(source: EnvSource, name: string): string | null {
+  const value = source[name]?.trim();
   return value ? value : null;
 }
 
-function envBoolean(name: string, fallback: boolean): boolean {
-  const value = env(name);
+function envBoolean(source: EnvSource, name: string, fallback: boolean): boolean {
+  const value = env(source, name);
   if (value === null) {
     return fallback;
   }
-  return !["0", "false", "no", "off"].includes(value.toLowerCase());
+  return !FALSE_VALUES.has(value.toLowerCase());
 }
 
-function envNumber(name: string, fallback: number): number {
-  const value = env(name);
+function envNumber(source: EnvSource, name: string, fallback: number): number {
+  const value = env(source, name);
   if (value === null) {
     return fallback;
   }
@@ -45,31 +61,47 @@ function envNumber(name: string, fallback: number): number {
   return parsed;
 }
 
-export function loadConfig(): AppConfig {
-  const gatewayToken = env("ASTRBOT_GATEWAY_TOKEN");
+function envGitHubAcceleration(source: EnvSource): string | null {
+  const value = env(source, "ASTRBOT_GITHUB_ACCELERATION");
+  if (value === null) {
+    return null;
+  }
+  const normalized = value.replace(/\/+$/, "");
+  if (
+    !GITHUB_ACCELERATION_DISABLE_VALUES.has(normalized.toLowerCase()) &&
+    !/^https?:\/\/\S+$/i.test(normalized)
+  ) {
+    throw new Error("ASTRBOT_GITHUB_ACCELERATION must be an http(s) URL or off.");
+  }
+  return normalized;
+}
+
+export function loadConfig(source: EnvSource = process.env): AppConfig {
+  const gatewayToken = env(source, "ASTRBOT_GATEWAY_TOKEN");
   if (!gatewayToken) {
     throw new Error("ASTRBOT_GATEWAY_TOKEN is required.");
   }
 
-  const capabilityMode = (env("ASTRBOT_CAPABILITY_MODE") ?? "full") as CapabilityMode;
+  const capabilityMode = (env(source, "ASTRBOT_CAPABILITY_MODE") ?? "full") as CapabilityMode;
   if (!CAPABILITY_MODES.has(capabilityMode)) {
     throw new Error(
       `ASTRBOT_CAPABILITY_MODE must be one of ${Array.from(CAPABILITY_MODES).join(", ")}.`,
     );
   }
 
-  const logView = (env("ASTRBOT_LOG_VIEW") ?? "compact") as LogView;
+  const logView = (env(source, "ASTRBOT_LOG_VIEW") ?? "compact") as LogView;
   if (!LOG_VIEWS.has(logView)) {
     throw new Error(`ASTRBOT_LOG_VIEW must be one of ${Array.from(LOG_VIEWS).join(", ")}.`);
   }
 
-  return {
-    gatewayUrl: (env("ASTRBOT_GATEWAY_URL") ?? "http://127.0.0.1:6324").replace(/\/+$/, ""),
+  return Object.freeze({
+    gatewayUrl: (env(source, "ASTRBOT_GATEWAY_URL") ?? "http://127.0.0.1:6324").replace(/\/+$/, ""),
     gatewayToken,
-    gatewayTimeout: envNumber("ASTRBOT_GATEWAY_TIMEOUT", 30_000),
+    gatewayTimeout: envNumber(source, "ASTRBOT_GATEWAY_TIMEOUT", 30_000),
     capabilityMode,
-    enableSearchTools: envBoolean("ASTRBOT_ENABLE_SEARCH_TOOLS", false),
+    enableSearchTools: envBoolean(source, "ASTRBOT_ENABLE_SEARCH_TOOLS", false),
     logView,
-    enableLogNoiseFiltering: envBoolean("ASTRBOT_ENABLE_LOG_NOISE_FILTERING", true),
-  };
+    enableLogNoiseFiltering: envBoolean(source, "ASTRBOT_ENABLE_LOG_NOISE_FILTERING", true),
+    githubAcceleration: envGitHubAcceleration(source),
+  });
 }
@@ -1,6 +1,11 @@
 import * as z from "zod/v4";
 
-import { ToolRegistrar, scoreToolQuery, withToolErrorBoundary } from "./tooling.js";
+import {
+  ToolCatalogEntry,
+  ToolRegistrar,
+  scoreToolQuery,
+  withToolErrorBoundary,
+} from "./tooling.js";
 
 export function registerDiscoveryTools(registrar: ToolRegistrar) {
   if (!registrar.runtime.config.enableSearchTools) {
@@ -22,25 +27,37 @@ export function registerDiscoveryTools(registrar: ToolRegistrar) {
       top_k: z.number().int().min(1).max(30).default(10),
     },
     async ({ query, top_k }) => {
-      const ranked = registrar.catalog
-        .filter((item) => item.enabled)
-        .map((item) => ({
-          ...item,
-          score: scoreToolQuery(query, item),
-        }))
-        .filter((item) => item.score > 0)
-        .sort((a, b) => b.score - a.score)
-        .slice(0, top_k);
+      // Inserting after equal scores keeps catalog order for ties.
+      let totalEnabled = 0;
+      const ranked: Array<{ item: ToolCatalogEntry; score: number }> = [];
+      for (const item of registrar.catalog) {
+        if (!item.enabled) {
+          continue;
+        }
+        totalEnabled += 1;
+        const score = scoreToolQuery(query, item);
+        if (score <= 0 || (ranked.length >= top_k && score <= ranked[ranked.length - 1].score)) {
+          continue;
+        }
+        let index = ranked.length;
+        while (index > 0 && ranked[index - 1].score < score) {
+          index -= 1;
+        }
+        ranked.splice(index, 0, { item, score });
+        if (ranked.length > top_k) {
+          ranked.pop();
+        }
+      }
       return {
         query,
-        total_enabled_tools: registrar.catalog.filter((item) => item.enabled).length,
-        results: ranked.map((item) => ({
+        total_enabled_tools: totalEnabled,
+        results: ranked.map(({ item, score }) => ({
           name: item.name,
           summary: item.summary,
           category: item.category,
           risk: item.risk,
           min_mode: item.minMode,
-          score: item.score,
+          score,
         })),
       };
     },
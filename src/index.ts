@@ -1,11 +1,3 @@
-import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
-import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js";
-
-import { GatewayClient } from "./clients.js";
-import { loadConfig } from "./config.js";
-import { buildInstructions, loadRuntimeHints } from "./runtime-hints.js";
-import { categorySummary, registerTools } from "./tools.js";
-
 const VERSION = "0.2.0";
 
 function summarizeCategories(summary: Record<string, number>): string {
@@ -21,6 +13,22 @@ async function main() {
     return;
   }
 
+  const [
+    { McpServer },
+    { StdioServerTransport },
+    { GatewayClient },
+    { loadConfig },
+    { buildInstructions, loadRuntimeHints },
+    { categorySummary, registerTools },
+  ] = await Promise.all([
+    import("@modelcontextprotocol/sdk/server/mcp.js"),
+    import("@modelcontextprotocol/sdk/server/stdio.js"),
+    import("./clients.js"),
+    import("./config.js"),
+    import("./runtime-hints.js"),
+    import("./tools.js"),
+  ]);
+
   const config = loadConfig();
   const gateway = new GatewayClient(config);
   const hints = await loadRuntimeHints(gateway);
@@ -44,6 +52,21 @@ async function main() {
 
   const catalog = registerTools(server, runtime);
   const categoryMap = categorySummary(catalog);
+  const capabilitiesText = JSON.stringify(
+    {
+      capability_mode: config.capabilityMode,
+      search_tools_enabled: config.enableSearchTools,
+      log_view: config.logView,
+      enable_log_noise_filtering: config.enableLogNoiseFiltering,
+      wake_prefix: hints.wakePrefix,
+      friend_message_needs_wake_prefix: hints.friendMessageNeedsWakePrefix,
+      reply_prefix: hints.replyPrefix,
+      category_counts: categoryMap,
+      categories: summarizeCategories(categoryMap),
+    },
+    null,
+    2,
+  );
   server.registerTool(
     "describe_runtime_capabilities",
     {
@@ -55,21 +78,7 @@ async function main() {
       content: [
         {
           type: "text",
-          text: JSON.stringify(
-            {
-              capability_mode: config.capabilityMode,
-              search_tools_enabled: config.enableSearchTools,
-              log_view: config.logView,
-              enable_log_noise_filtering: config.enableLogNoiseFiltering,
-              wake_prefix: hints.wakePrefix,
-              friend_message_needs_wake_prefix: hints.friendMessageNeedsWakePrefix,
-              reply_prefix: hints.replyPrefix,
-              category_counts: categoryMap,
-              categories: summarizeCategories(categoryMap),
-            },
-            null,
-            2,
-          ),
+          text: capabilitiesText,
         },
       ],
     }),
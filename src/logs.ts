@@ -11,6 +11,7 @@ export interface CompactLogEntry {
 }
 
 const ANSI_PATTERN = /\u001b\[[0-9;]*m/g;
+const NOISE_LEVELS = new Set(["DEBUG", "TRACE"]);
 const NOISE_PATTERNS = [
   /keep-alive/i,
   /heartbeat/i,
@@ -19,6 +20,8 @@ const NOISE_PATTERNS = [
   /GET \/logs\/compact/i,
   /GET \/logs\/stream/i,
 ];
+const LOG_LIST_KEYS = ["logs", "history", "entries", "items", "events"] as const;
+const LOG_ENVELOPE_KEYS = ["data", "payload", "result"] as const;
 
 function asRecord(value: unknown): Record<string, unknown> | null {
   if (!value || typeof value !== "object" || Array.isArray(value)) {
@@ -42,7 +45,8 @@ function cleanMessage(value: string): string {
 }
 
 function isNoise(entry: CompactLogEntry): boolean {
-  if (["DEBUG", "TRACE"].includes(entry.level.toUpperCase())) {
+  // compactOne already upper-cases the level.
+  if (NOISE_LEVELS.has(entry.level)) {
     return true;
   }
   return NOISE_PATTERNS.some((pattern) => pattern.test(entry.message));
@@ -94,14 +98,14 @@ export function extractLogEntries(payload: unknown, depth = 0): unknown[] {
     return [];
   }
 
-  for (const key of ["logs", "history", "entries", "items", "events"]) {
+  for (const key of LOG_LIST_KEYS) {
     const value = record[key];
     if (Array.isArray(value)) {
       return value;
     }
   }
 
-  for (const key of ["data", "payload", "result"]) {
+  for (const key of LOG_ENVELOPE_KEYS) {
     if (!(key in record)) {
       continue;
     }
@@ -119,11 +123,13 @@ export function compactLogs(
   options: CompactLogsOptions,
 ): CompactLogEntry[] {
   const maxEntries = options.maxEntries ?? 200;
+  // Walks newest-first; a run of repeated entries still collapses to its
+  // earliest occurrence, as in a forward pass.
   const compacted: CompactLogEntry[] = [];
-  let previousFingerprint = "";
+  let laterFingerprint = "";
 
-  for (const raw of rawLogs) {
-    const entry = compactOne(raw);
+  for (let index = rawLogs.length - 1; index >= 0; index -= 1) {
+    const entry = compactOne(rawLogs[index]);
     if (!entry.message) {
       continue;
     }
@@ -131,14 +137,19 @@ export function compactLogs(
       continue;
     }
     const fingerprint = `${entry.level}|${entry.component}|${entry.message}`;
-    if (fingerprint === previousFingerprint) {
+    if (fingerprint === laterFingerprint) {
+      compacted[compacted.length - 1] = entry;
       continue;
     }
-    previousFingerprint = fingerprint;
+    // A zero limit keeps everything, as slice(-0) did before.
+    if (maxEntries > 0 && compacted.length >= maxEntries) {
+      break;
+    }
+    laterFingerprint = fingerprint;
     compacted.push(entry);
   }
 
-  return compacted.slice(-maxEntries);
+  return compacted.reverse();
 }
 
 export interface LogNeedles {
@@ -135,12 +135,18 @@ function normalizeSpecialText(value: unknown): string {
   return extractTraceReplyText(trimmed) || trimmed;
 }
 
+const INLINE_PART_FIELDS = ["text", "url", "name", "qq", "user_id"] as const;
+
 function normalizeInlinePart(type: string, fields: Record<string, unknown>) {
   const normalized: Record<string, unknown> = { type };
-  for (const key of ["text", "url", "name", "qq", "user_id"]) {
+  for (const key of INLINE_PART_FIELDS) {
     const value = fields[key];
-    if (typeof value === "string" && value.trim()) {
-      normalized[key] = value.trim();
+    if (typeof value !== "string") {
+      continue;
+    }
+    const trimmed = value.trim();
+    if (trimmed) {
+      normalized[key] = trimmed;
     }
   }
   return normalized;
@@ -157,32 +163,34 @@ function normalizeGatewayMessagePart(part: unknown): Record<string, unknown> | n
   }
 
   const data = asRecord(record.data) ?? {};
-  if (type === "plain" || type === "text") {
-    const textCandidate = data.text ?? record.text;
-    const normalizedText = normalizeSpecialText(textCandidate);
-    if (normalizedText) {
-      return { type: "plain", text: normalizedText };
+  switch (type) {
+    case "plain":
+    case "text": {
+      const normalizedText = normalizeSpecialText(data.text ?? record.text);
+      if (normalizedText) {
+        return { type: "plain", text: normalizedText };
+      }
+      break;
+    }
+    case "at": {
+      const qq = typeof data.qq === "string" ? data.qq.trim() : "";
+      const name = typeof data.name === "string" ? data.name.trim() : "";
+      const text = typeof record.text === "string" ? record.text.trim() : "";
+      return normalizeInlinePart("at", {
+        text: text || (name ? `@${name}` : qq ? `@${qq}` : ""),
+        qq,
+        name,
+      });
+    }
+    case "file":
+    case "image": {
+      const urlCandidate = data.url ?? data.file ?? data.file_ ?? record.url;
+      const nameCandidate = data.name ?? record.name;
+      return normalizeInlinePart(type, {
+        url: typeof urlCandidate === "string" ? urlCandidate : "",
+        name: typeof nameCandidate === "string" ? nameCandidate : "",
+      });
     }
-  }
-
-  if (type === "at") {
-    const qq = typeof data.qq === "string" ? data.qq.trim() : "";
-    const name = typeof data.name === "string" ? data.name.trim() : "";
-    const text = typeof record.text === "string" ? record.text.trim() : "";
-    return normalizeInlinePart("at", {
-      text: text || (name ? `@${name}` : qq ? `@${qq}` : ""),
-      qq,
-      name,
-    });
-  }
-
-  if (type === "file" || type === "image") {
-    const urlCandidate = data.url ?? data.file ?? data.file_ ?? record.url;
-    const nameCandidate = data.name ?? record.name;
-    return normalizeInlinePart(type, {
-      url: typeof urlCandidate === "string" ? urlCandidate : "",
-      name: typeof nameCandidate === "string" ? nameCandidate : "",
-    });
   }
 
   const textCandidate = data.text ?? record.text;
@@ -200,42 +208,51 @@ function normalizeGatewayMessagePart(part: unknown): Record<string, unknown> | n
 }
 
 function normalizeGatewayMessageParts(parts: unknown): Record<string, unknown>[] {
+  const normalized: Record<string, unknown>[] = [];
   if (!Array.isArray(parts)) {
-    return [];
+    return normalized;
   }
-  return parts
-    .map((part) => normalizeGatewayMessagePart(part))
-    .filter((part): part is Record<string, unknown> => Boolean(part));
+  for (const part of parts) {
+    const item = normalizeGatewayMessagePart(part);
+    if (item) {
+      normalized.push(item);
+    }
+  }
+  return normalized;
+}
+
+const MEDIA_PART_LABELS = new Map([
+  ["file", "[file]"],
+  ["image", "[image]"],
+]);
+
+// Parts reaching here come from normalizeGatewayMessagePart, so every field
+// is already a trimmed string.
+function messagePartToPlainText(part: Record<string, unknown>): string {
+  const type = String(part.type);
+  const text = typeof part.text === "string" ? part.text : "";
+  if (text || type === "plain" || type === "at") {
+    return text;
+  }
+
+  const url = typeof part.url === "string" ? part.url : "";
+  const label = MEDIA_PART_LABELS.get(type);
+  if (label) {
+    const name = typeof part.name === "string" ? part.name : "";
+    return `${label} ${url || name}`.trim();
+  }
+  return url ? `[${type}] ${url}` : "";
 }
 
 function extractPlainTextFromParts(parts: unknown): string {
-  return normalizeGatewayMessageParts(parts)
-    .map((part) => {
-      const type = String(part.type ?? "").trim();
-      const text = typeof part.text === "string" ? part.text.trim() : "";
-      const url = typeof part.url === "string" ? part.url.trim() : "";
-      const name = typeof part.name === "string" ? part.name.trim() : "";
-
-      if (type === "plain" || type === "at") {
-        return text;
-      }
-      if (text) {
-        return text;
-      }
-      if (type === "file") {
-        return `[file] ${url || name}`.trim();
-      }
-      if (type === "image") {
-        return `[image] ${url || name}`.trim();
-      }
-      if (url) {
-        return `[${type}] ${url}`.trim();
-      }
-      return "";
-    })
-    .filter(Boolean)
-    .join("\n")
-    .trim();
+  let joined = "";
+  for (const part of normalizeGatewayMessageParts(parts)) {
+    const line = messagePartToPlainText(part);
+    if (line) {
+      joined = joined ? `${joined}\n${line}` : line;
+    }
+  }
+  return joined.trim();
 }
 
 function isMetricsMessage(text: string): boolean {
@@ -571,11 +588,11 @@ async function waitForReplyHistory(
     };
   }
 
-  const deadline = Date.now() + waitSeconds * 1000;
+  const deadline = performance.now() + waitSeconds * 1000;
   let checks = 0;
   let history: Record<string, unknown>[] = [];
 
-  while (Date.now() <= deadline) {
+  while (performance.now() <= deadline) {
     history = await fetchMessageHistory(runtime, target.platformId, target.userId, pageSize);
     checks += 1;
     const extracted = extractReplyFromHistory(history, options);
@@ -588,7 +605,7 @@ async function waitForReplyHistory(
         reason: "reply_found" as const,
       };
     }
-    if (Date.now() >= deadline) {
+    if (performance.now() >= deadline) {
       break;
     }
     await new Promise((resolve) => setTimeout(resolve, pollIntervalSeconds * 1000));
@@ -847,12 +864,12 @@ async function invokePlatformSessionCapture(
     }
   }
 
-  const deadline = Date.now() + options.waitSeconds * 1000;
+  const deadline = performance.now() + options.waitSeconds * 1000;
   let checks = 0;
   let logs: unknown[] = [];
 
-  while (Date.now() <= deadline) {
-    const remainingMs = deadline - Date.now();
+  while (performance.now() <= deadline) {
+    const remainingMs = deadline - performance.now();
     const stepSeconds = Math.max(
       0,
       Math.min(options.pollIntervalSeconds, Math.ceil(remainingMs / 1000)),
@@ -880,7 +897,7 @@ async function invokePlatformSessionCapture(
       };
     }
 
-    if (Date.now() >= deadline) {
+    if (performance.now() >= deadline) {
       break;
     }
   }
@@ -1066,9 +1083,9 @@ export async function waitForReplyLogs(
 
   if (options.waitSeconds <= 0) {
     const scopedLogs = await fetchScopedLogs(0);
-    const globalLogs = await fetchGlobalLogs(0);
     const sessionReply = extractReplyFromSessionLogs(scopedLogs, options);
-    const sendReply = findReplyFromSendLogs(globalLogs, options);
+    const globalLogs = sessionReply ? [] : await fetchGlobalLogs(0);
+    const sendReply = sessionReply ? null : findReplyFromSendLogs(globalLogs, options);
     return {
       reply: sessionReply ?? sendReply?.reply ?? null,
       logs:
@@ -1084,21 +1101,21 @@ export async function waitForReplyLogs(
     };
   }
 
-  const deadline = Date.now() + options.waitSeconds * 1000;
+  const deadline = performance.now() + options.waitSeconds * 1000;
   let checks = 0;
   let logs: unknown[] = [];
 
-  while (Date.now() <= deadline) {
-    const remainingMs = deadline - Date.now();
+  while (performance.now() <= deadline) {
+    const remainingMs = deadline - performance.now();
     const stepSeconds = Math.max(
       0,
       Math.min(options.pollIntervalSeconds, Math.ceil(remainingMs / 1000)),
     );
     const scopedLogs = await fetchScopedLogs(stepSeconds);
-    const globalLogs = await fetchGlobalLogs(0);
     checks += 1;
     const sessionReply = extractReplyFromSessionLogs(scopedLogs, options);
-    const sendReply = findReplyFromSendLogs(globalLogs, options);
+    const globalLogs = sessionReply ? [] : await fetchGlobalLogs(0);
+    const sendReply = sessionReply ? null : findReplyFromSendLogs(globalLogs, options);
     const reply = sessionReply ?? sendReply?.reply ?? null;
     logs =
       sessionReply
@@ -1116,7 +1133,7 @@ export async function waitForReplyLogs(
         reason: "reply_found",
       };
     }
-    if (Date.now() >= deadline) {
+    if (performance.now() >= deadline) {
       break;
     }
   }
@@ -1218,7 +1235,7 @@ export async function waitForEventToSettle(
     };
   }
 
-  const start = Date.now();
+  const start = performance.now();
   const deadline = start + waitSeconds * 1000;
   let quietForMs = 0;
   let previousFingerprint = "";
@@ -1226,7 +1243,7 @@ export async function waitForEventToSettle(
   let rawLogs: unknown[] = [];
 
   while (true) {
-    const remainingMs = deadline - Date.now();
+    const remainingMs = deadline - performance.now();
     const stepSeconds = Math.max(0, Math.min(pollIntervalSeconds, Math.ceil(remainingMs / 1000)));
     rawLogs = await fetchEventLogs(runtime, eventId, stepSeconds, maxEntries);
     checks += 1;
@@ -1243,18 +1260,18 @@ export async function waitForEventToSettle(
       return {
         rawLogs,
         logs: compactOrRawLogs(runtime, rawLogs, maxEntries),
-        waitedSeconds: Math.round((Date.now() - start) / 1000),
+        waitedSeconds: Math.round((performance.now() - start) / 1000),
         settled: true,
         reason: "quiet_window",
         checks,
       };
     }
 
-    if (Date.now() >= deadline) {
+    if (performance.now() >= deadline) {
       return {
         rawLogs,
         logs: compactOrRawLogs(runtime, rawLogs, maxEntries),
-        waitedSeconds: Math.round((Date.now() - start) / 1000),
+        waitedSeconds: Math.round((performance.now() - start) / 1000),
         settled: false,
         reason: "timeout",
         checks,
@@ -1416,9 +1433,7 @@ export function registerMessageTools(registrar: ToolRegistrar) {
             },
           };
         }
-        return {
-          ...result,
-        };
+        return result;
       }
 
       const watch = await waitForEventToSettle(runtime, eventId, {
@@ -1429,6 +1444,8 @@ export function registerMessageTools(registrar: ToolRegistrar) {
       });
 
       const historyTarget = deriveHistoryTarget(injection);
+      const sessionNeedle = String(injection.unified_msg_origin ?? "");
+      const senderName = display_name ?? resolvedSenderId;
       const remainingWaitSeconds = Math.max(0, resolvedWaitSeconds - watch.waitedSeconds);
       const replyLookup = await waitForReplyHistory(runtime, historyTarget, {
         waitSeconds: remainingWaitSeconds,
@@ -1436,7 +1453,7 @@ export function registerMessageTools(registrar: ToolRegistrar) {
         pageSize: Math.min(resolvedMaxEntries, 100),
         inputText,
         senderId: resolvedSenderId,
-        senderName: display_name ?? resolvedSenderId,
+        senderName,
         notBeforeMs: requestStartedAt,
       });
       const platformReplyLookup =
@@ -1465,10 +1482,10 @@ export function registerMessageTools(registrar: ToolRegistrar) {
                 messageType: String(injection.message_type ?? message_type ?? "").trim() || undefined,
               },
               {
-                sessionNeedle: String(injection.unified_msg_origin ?? ""),
+                sessionNeedle,
                 inputText,
                 senderId: resolvedSenderId,
-                senderName: display_name ?? resolvedSenderId,
+                senderName,
                 waitSeconds: remainingWaitSeconds,
                 pollIntervalSeconds: resolvedPollIntervalSeconds,
                 maxEntries: Math.min(resolvedMaxEntries, 100),
@@ -1484,10 +1501,10 @@ export function registerMessageTools(registrar: ToolRegistrar) {
               reason: "disabled" as const,
             }
           : await waitForReplyLogs(runtime, {
-              sessionNeedle: String(injection.unified_msg_origin ?? ""),
+              sessionNeedle,
               inputText,
               senderId: resolvedSenderId,
-              senderName: display_name ?? resolvedSenderId,
+              senderName,
               waitSeconds: remainingWaitSeconds,
               pollIntervalSeconds: resolvedPollIntervalSeconds,
               maxEntries: resolvedMaxEntries,
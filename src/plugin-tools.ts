@@ -1,12 +1,12 @@
 import * as z from "zod/v4";
-import { existsSync } from "node:fs";
 
+import { GITHUB_ACCELERATION_DISABLE_VALUES } from "./config.js";
 import {
   ToolRegistrar,
   encodeSegment,
   withToolErrorBoundary,
 } from "./tooling.js";
-import { redactSensitiveData } from "./utils.js";
+import { pathExists, redactSensitiveData } from "./utils.js";
 
 const DEFAULT_GITHUB_ACCELERATION_BASES = [
   "https://edgeone.gh-proxy.com",
@@ -15,20 +15,14 @@ const DEFAULT_GITHUB_ACCELERATION_BASES = [
   "https://gh.llkk.cc",
 ];
 
-const GITHUB_ACCELERATION_DISABLE_VALUES = new Set([
-  "0",
-  "false",
-  "no",
-  "none",
-  "off",
-  "direct",
-  "disable",
-  "disabled",
-]);
-
 const GITHUB_ACCELERATION_TEST_URL =
   "https://github.com/AstrBotDevs/AstrBot/raw/refs/heads/master/.python-version";
 
+const GITHUB_REPO_URL_PATTERN = /^https?:\/\/github\.com\//i;
+const HTTP_URL_PATTERN = /^https?:\/\//i;
+// URL.hostname keeps the brackets around IPv6 literals.
+const LOOPBACK_HOSTNAMES = new Set(["127.0.0.1", "localhost", "[::1]"]);
+
 let cachedGitHubAcceleration: string | null | undefined;
 
 function asRecord(value: unknown): Record<string, unknown> | null {
@@ -61,11 +55,15 @@ function isDisabledGitHubAcceleration(value: string) {
 }
 
 function asNonEmptyString(value: unknown) {
-  return typeof value === "string" && value.trim() ? value.trim() : "";
+  return typeof value === "string" ? value.trim() : "";
+}
+
+function isHttpUrl(value: string) {
+  return HTTP_URL_PATTERN.test(value);
 }
 
 function looksLikeGitHubRepoUrl(value: string) {
-  return /^https?:\/\/github\.com\//i.test(value.trim());
+  return GITHUB_REPO_URL_PATTERN.test(value.trim());
 }
 
 async function probeGitHubAcceleration(baseUrl: string, timeoutMs = 5_000) {
@@ -91,6 +89,7 @@ async function probeGitHubAcceleration(baseUrl: string, timeoutMs = 5_000) {
 
 export async function resolveGitHubAcceleration(options: {
   explicit?: string;
+  configured?: string | null;
   refresh?: boolean;
   candidates?: string[];
   probe?: (baseUrl: string) => Promise<boolean>;
@@ -100,9 +99,9 @@ export async function resolveGitHubAcceleration(options: {
     return isDisabledGitHubAcceleration(explicit) ? "" : explicit;
   }
 
-  const envOverride = normalizeGitHubAcceleration(process.env.ASTRBOT_GITHUB_ACCELERATION);
-  if (envOverride) {
-    return isDisabledGitHubAcceleration(envOverride) ? "" : envOverride;
+  const configured = normalizeGitHubAcceleration(options.configured);
+  if (configured) {
+    return isDisabledGitHubAcceleration(configured) ? "" : configured;
   }
 
   if (!options.refresh && cachedGitHubAcceleration !== undefined) {
@@ -296,9 +295,7 @@ function compactPluginMutationResult(
 
 function isLoopbackGateway(gatewayUrl: string): boolean {
   try {
-    const parsed = new URL(gatewayUrl);
-    const hostname = parsed.hostname.toLowerCase();
-    return hostname === "127.0.0.1" || hostname === "localhost" || hostname === "::1";
+    return LOOPBACK_HOSTNAMES.has(new URL(gatewayUrl).hostname.toLowerCase());
   } catch {
     return false;
   }
@@ -306,6 +303,7 @@ function isLoopbackGateway(gatewayUrl: string): boolean {
 
 export function registerPluginTools(registrar: ToolRegistrar) {
   const { runtime } = registrar;
+  const gatewayIsLoopback = isLoopbackGateway(runtime.config.gatewayUrl);
 
   withToolErrorBoundary(
     registrar,
@@ -460,13 +458,16 @@ export function registerPluginTools(registrar: ToolRegistrar) {
       proxy: z.string().optional().describe("Deprecated alias of github_acceleration."),
     },
     async ({ source, source_type, github_acceleration, proxy }) => {
-      const looksLikeRepo = /^https?:\/\//i.test(source) || source.endsWith(".git");
-      const sourceExists = existsSync(source);
+      const looksLikeRepo = isHttpUrl(source) || source.endsWith(".git");
+      const sourceExists =
+        source_type === "upload" || (source_type === "auto" && !looksLikeRepo)
+          ? await pathExists(source)
+          : false;
       const type =
         source_type === "auto"
           ? looksLikeRepo
             ? "repo"
-            : sourceExists && isLoopbackGateway(runtime.config.gatewayUrl)
+            : sourceExists && gatewayIsLoopback
               ? "zip"
               : sourceExists
                 ? "upload"
@@ -475,7 +476,10 @@ export function registerPluginTools(registrar: ToolRegistrar) {
 
       if (type === "repo") {
         const resolvedAcceleration = looksLikeGitHubRepoUrl(source)
-          ? await resolveGitHubAcceleration({ explicit: github_acceleration ?? proxy })
+          ? await resolveGitHubAcceleration({
+              explicit: github_acceleration ?? proxy,
+              configured: runtime.config.githubAcceleration,
+            })
           : normalizeGitHubAcceleration(github_acceleration ?? proxy);
         const payload = await runtime.gateway.request("POST", "/plugins/install/repo", {
           body: { repo_url: source, proxy: resolvedAcceleration },
@@ -574,7 +578,10 @@ export function registerPluginTools(registrar: ToolRegistrar) {
       );
       const repo = asNonEmptyString(plugin?.repo);
       const resolvedAcceleration = looksLikeGitHubRepoUrl(repo)
-        ? await resolveGitHubAcceleration({ explicit: github_acceleration ?? proxy })
+        ? await resolveGitHubAcceleration({
+            explicit: github_acceleration ?? proxy,
+            configured: runtime.config.githubAcceleration,
+          })
         : normalizeGitHubAcceleration(github_acceleration ?? proxy);
       const payload = await runtime.gateway.request(
         "POST",
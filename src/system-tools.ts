@@ -4,6 +4,8 @@ import { extractLogEntries, filterLogsByContains, filterLogsByNeedles } from "./
 import { ToolRegistrar, compactOrRawLogs, encodeSegment, withToolErrorBoundary } from "./tooling.js";
 import { redactSensitiveData } from "./utils.js";
 
+const RESTART_INITIAL_CHECK_DELAY_MS = 250;
+
 function summarizeRestartAck(payload: unknown) {
   const record = (payload && typeof payload === "object" ? payload : {}) as Record<string, unknown>;
   return {
@@ -29,7 +31,7 @@ export function registerSystemTools(registrar: ToolRegistrar) {
     async () => {
       const [health, gatewayMeta] = await Promise.allSettled([
         runtime.gateway.request("GET", "/health"),
-        runtime.gateway.request("GET", "/meta"),
+        runtime.gateway.request("GET", "/meta", { cacheTtlMs: 300_000 }),
       ]);
       return {
         capability_mode: runtime.config.capabilityMode,
@@ -143,22 +145,25 @@ export function registerSystemTools(registrar: ToolRegistrar) {
     },
     {
       max_wait_seconds: z.number().int().min(5).max(180).default(60),
-      check_interval_seconds: z.number().int().min(1).max(10).default(2),
+      check_interval_seconds: z.number().int().min(1).max(10).default(2).describe("Longest pause between health checks. Checks start at 0.25s and back off up to this interval."),
       include_status: z.boolean().default(false),
     },
     async ({ max_wait_seconds, check_interval_seconds, include_status }) => {
       const restartResponse = await runtime.gateway.request("POST", "/system/restart-core");
       const restartAck = summarizeRestartAck(restartResponse);
-      const start = Date.now();
+      const start = performance.now();
+      const deadline = start + max_wait_seconds * 1000;
+      const maxDelayMs = check_interval_seconds * 1000;
+      let delayMs = Math.min(RESTART_INITIAL_CHECK_DELAY_MS, maxDelayMs);
       let checks = 0;
 
-      while (Date.now() - start < max_wait_seconds * 1000) {
+      while (performance.now() < deadline) {
         try {
           const health = await runtime.gateway.request("GET", "/health");
           const result: Record<string, unknown> = {
             restarted: true,
             ...restartAck,
-            waited_seconds: Math.round((Date.now() - start) / 1000),
+            waited_seconds: Math.round((performance.now() - start) / 1000),
             checks,
           };
           if (include_status) {
@@ -168,7 +173,9 @@ export function registerSystemTools(registrar: ToolRegistrar) {
           }
           return result;
         } catch {
-          await new Promise((resolve) => setTimeout(resolve, check_interval_seconds * 1000));
+          const remainingMs = deadline - performance.now();
+          await new Promise((resolve) => setTimeout(resolve, Math.max(0, Math.min(delayMs, remainingMs))));
+          delayMs = Math.min(delayMs * 2, maxDelayMs);
           checks += 1;
         }
       }
@@ -183,3 +183,13 @@ export function withToolErrorBoundary(
     }
   });
 }
+
+export function registerGatewayRead(
+  registrar: ToolRegistrar,
+  entry: Omit<ToolCatalogEntry, "enabled">,
+  path: string,
+  options: { cacheTtlMs?: number } = {},
+) {
+  const { gateway } = registrar.runtime;
+  withToolErrorBoundary(registrar, entry, {}, async () => gateway.request("GET", path, options));
+}
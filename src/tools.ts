@@ -1,10 +1,10 @@
 ﻿import * as z from "zod/v4";
-import { existsSync } from "node:fs";
 import { mkdir, writeFile } from "node:fs/promises";
 import { tmpdir } from "node:os";
 import { join } from "node:path";
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 
+import { GatewaySseEvent } from "./clients.js";
 import { registerDiscoveryTools } from "./discovery-tools.js";
 import { registerMessageTools } from "./message-tools.js";
 import { registerPluginTools } from "./plugin-tools.js";
@@ -16,16 +16,24 @@ import {
   categorySummary,
   compactOrRawLogs,
   encodeSegment,
+  registerGatewayRead,
   withToolErrorBoundary,
 } from "./tooling.js";
 import { compactMessageToolLogs } from "./message-tools.js";
 import { richResult } from "./result.js";
-import { redactSensitiveData, searchObject } from "./utils.js";
+import { pathExists, redactSensitiveData, searchObject } from "./utils.js";
 
 export { categorySummary };
 export type { Runtime, ToolCatalogEntry };
 
 const seenInternalToolParameterHints = new Set<string>();
+const UNSAFE_FILENAME_CHARS = /[\\/:*?"<>|]/g;
+const INVOCATION_EVENT_TYPES = new Set(["accepted", "result", "completed", "failed"]);
+const SEARCH_CONFIG_CACHE_TTL_MS = 5_000;
+const STREAM_MAX_EVENTS = 1000;
+const PROVIDER_SOURCE_SUFFIX_PATTERN = /[（(].*?[)）]/g;
+const ATTACHMENT_URL_BASE = new URL("http://127.0.0.1");
+const ATTACHMENT_PATH_PREFIXES = ["/attachments/", "/api/file/"] as const;
 
 function asRecord(value: unknown): Record<string, unknown> | null {
   if (!value || typeof value !== "object" || Array.isArray(value)) {
@@ -78,17 +86,24 @@ function isInternalToolTaskTerminal(status: string | null) {
 }
 
 function extractTextPartsFromResultContent(content: unknown) {
-  const items = Array.isArray(content) ? content : [];
-  return items
-    .map((item) => asRecord(item))
-    .map((item) => {
-      if (typeof item?.text === "string") {
-        return item.text.trim();
-      }
+  const texts: string[] = [];
+  if (!Array.isArray(content)) {
+    return texts;
+  }
+  for (const entry of content) {
+    const item = asRecord(entry);
+    let text = "";
+    if (typeof item?.text === "string") {
+      text = item.text.trim();
+    } else {
       const raw = asRecord(item?.raw);
-      return typeof raw?.text === "string" ? raw.text.trim() : "";
-    })
-    .filter(Boolean);
+      text = typeof raw?.text === "string" ? raw.text.trim() : "";
+    }
+    if (text) {
+      texts.push(text);
+    }
+  }
+  return texts;
 }
 
 function compactInternalToolLogEntries(
@@ -127,10 +142,17 @@ function compactInternalToolMessagePart(part: unknown) {
 }
 
 function compactInternalToolMessageParts(parts: unknown) {
-  const items = Array.isArray(parts) ? parts : [];
-  return items
-    .map((item) => compactInternalToolMessagePart(item))
-    .filter((item) => item !== null && item !== undefined);
+  const compacted: unknown[] = [];
+  if (!Array.isArray(parts)) {
+    return compacted;
+  }
+  for (const part of parts) {
+    const item = compactInternalToolMessagePart(part);
+    if (item !== null && item !== undefined) {
+      compacted.push(item);
+    }
+  }
+  return compacted;
 }
 
 function resolveInternalToolAttachmentPath(part: Record<string, unknown>) {
@@ -140,8 +162,8 @@ function resolveInternalToolAttachmentPath(part: Record<string, unknown>) {
       continue;
     }
     try {
-      const url = new URL(candidate, "http://127.0.0.1");
-      if (url.pathname.startsWith("/attachments/") || url.pathname.startsWith("/api/file/")) {
+      const url = new URL(candidate, ATTACHMENT_URL_BASE);
+      if (ATTACHMENT_PATH_PREFIXES.some((prefix) => url.pathname.startsWith(prefix))) {
         return `${url.pathname}${url.search}`;
       }
     } catch {
@@ -168,8 +190,9 @@ async function materializeInternalToolAttachment(
   const tempDir = join(tmpdir(), "astrbot-mcp", "attachments");
   await mkdir(tempDir, { recursive: true });
 
-  const safeName = filename.replace(/[\\/:*?"<>|]/g, "_");
-  const localPath = join(tempDir, `${attachmentId}-${safeName}`);
+  const safeId = attachmentId.replace(UNSAFE_FILENAME_CHARS, "_");
+  const safeName = filename.replace(UNSAFE_FILENAME_CHARS, "_");
+  const localPath = join(tempDir, `${safeId}-${safeName}`);
   const inlineBase64 = typeof part.base64 === "string" ? part.base64.trim() : "";
   let buffer: Buffer;
   if (inlineBase64) {
@@ -189,52 +212,54 @@ async function materializeInternalToolAttachment(
   };
 }
 
-async function buildInternalToolImageArtifacts(runtime: Runtime, parts: unknown) {
-  const items = Array.isArray(parts) ? parts : [];
-  const artifacts: Array<{
-    attachmentId: string | null;
-    localPath: string | null;
-    content: { type: "image"; data: string; mimeType: string };
-  }> = [];
-  for (const item of items) {
-    const record = asRecord(item);
-    if (!record || record.type !== "image") {
-      continue;
-    }
-    let data = typeof record.base64 === "string" ? record.base64.trim() : "";
-    let localPath: string | null = null;
-    try {
-      const downloaded = await materializeInternalToolAttachment(runtime, record);
-      if (downloaded) {
-        localPath = downloaded.localPath;
-        if (!data) {
-          data = downloaded.buffer.toString("base64");
-        }
-      }
-    } catch {
+async function buildInternalToolImageArtifact(runtime: Runtime, record: Record<string, unknown>) {
+  let data = typeof record.base64 === "string" ? record.base64.trim() : "";
+  let localPath: string | null = null;
+  try {
+    const downloaded = await materializeInternalToolAttachment(runtime, record);
+    if (downloaded) {
+      localPath = downloaded.localPath;
       if (!data) {
-        continue;
+        data = downloaded.buffer.toString("base64");
       }
     }
+  } catch {
     if (!data) {
-      continue;
+      return null;
     }
-    const mimeType =
-      typeof record.mime_type === "string" && record.mime_type.trim()
-        ? record.mime_type.trim()
-        : "image/jpeg";
-    artifacts.push({
-      attachmentId:
-        typeof record.attachment_id === "string" ? record.attachment_id : null,
-      localPath,
-      content: {
-        type: "image",
-        data,
-        mimeType,
-      },
-    });
   }
-  return artifacts;
+  if (!data) {
+    return null;
+  }
+  const mimeType =
+    typeof record.mime_type === "string" && record.mime_type.trim()
+      ? record.mime_type.trim()
+      : "image/jpeg";
+  return {
+    attachmentId:
+      typeof record.attachment_id === "string" ? record.attachment_id : null,
+    localPath,
+    content: {
+      type: "image" as const,
+      data,
+      mimeType,
+    },
+  };
+}
+
+async function buildInternalToolImageArtifacts(runtime: Runtime, parts: unknown) {
+  const items = Array.isArray(parts) ? parts : [];
+  const images: Record<string, unknown>[] = [];
+  for (const item of items) {
+    const record = asRecord(item);
+    if (record && record.type === "image") {
+      images.push(record);
+    }
+  }
+  const artifacts = await Promise.all(
+    images.map((record) => buildInternalToolImageArtifact(runtime, record)),
+  );
+  return artifacts.filter((artifact) => artifact !== null);
 }
 
 export function compactInternalTool(
@@ -289,16 +314,20 @@ function extractInternalToolText(payload: unknown) {
     return emitted.text.trim();
   }
 
+  const texts = new Set<string>();
   const results = Array.isArray(record.results) ? record.results : [];
-  const texts = results
-    .map((item) => asRecord(item))
-    .flatMap((item) => {
-      const directText = typeof item?.text === "string" ? item.text.trim() : "";
-      const contentTexts = extractTextPartsFromResultContent(item?.content);
-      return [directText, ...contentTexts].filter(Boolean);
-    });
-  if (texts.length > 0) {
-    return [...new Set(texts)].join("\n\n");
+  for (const item of results) {
+    const result = asRecord(item);
+    const directText = typeof result?.text === "string" ? result.text.trim() : "";
+    if (directText) {
+      texts.add(directText);
+    }
+    for (const text of extractTextPartsFromResultContent(result?.content)) {
+      texts.add(text);
+    }
+  }
+  if (texts.size > 0) {
+    return [...texts].join("\n\n");
   }
 
   if (typeof record.result_text === "string" && record.result_text.trim()) {
@@ -368,7 +397,7 @@ function compactInternalToolTaskEvent(
   const data = event.data;
   let compactedData: unknown = data;
 
-  if (eventType && ["accepted", "result", "completed", "failed"].includes(eventType)) {
+  if (eventType && INVOCATION_EVENT_TYPES.has(eventType)) {
     compactedData = compactInternalToolInvocation(data, {
       includeParameters: options.includeParameters,
       includeArguments: options.includeArguments,
@@ -395,6 +424,35 @@ function compactInternalToolTaskEvent(
   });
 }
 
+export async function collectInternalToolTaskEvents(
+  source: AsyncIterable<GatewaySseEvent>,
+  options: {
+    includeParameters?: boolean;
+    includeArguments?: boolean;
+    includeDebug?: boolean;
+    maxEvents?: number;
+  } = {},
+) {
+  const maxEvents = options.maxEvents ?? STREAM_MAX_EVENTS;
+  const events: unknown[] = [];
+  let truncated = false;
+  for await (const event of source) {
+    const compacted = compactInternalToolTaskEvent(event.data, options);
+    if (compacted !== null && compacted !== undefined) {
+      events.push(compacted);
+    }
+    const eventType = asRecord(event.data)?.type;
+    if (isInternalToolTaskTerminal(typeof eventType === "string" ? eventType : null)) {
+      break;
+    }
+    if (events.length >= maxEvents) {
+      truncated = true;
+      break;
+    }
+  }
+  return { events, truncated };
+}
+
 export function compactInternalToolInvocation(
   payload: unknown,
   options: {
@@ -451,7 +509,7 @@ export function compactInternalToolInvocation(
         : status === "failed"
           ? false
           : completed,
-    error: typeof record?.error === "string" && record.error.trim() ? record.error.trim() : null,
+    error: typeof record?.error === "string" ? record.error.trim() || null : null,
     conversation_id:
       typeof record?.conversation_id === "string" ? record.conversation_id : null,
     message_id: typeof record?.message_id === "string" ? record.message_id : null,
@@ -481,43 +539,51 @@ async function buildInternalToolRichResult(
       ? compactInternalToolLogEntries(runtime, rawLogs, options.logLimit)
       : [];
 
-  const rawMessageParts =
-    Array.isArray(asRecord(asRecord(payload)?.emitted)?.message_parts)
-      ? asRecord(asRecord(payload)?.emitted)?.message_parts
-      : Array.isArray(record?.message_parts)
-        ? record.message_parts
-        : Array.isArray(asRecord(compactedRecord?.task)?.message_parts)
-          ? asRecord(compactedRecord?.task)?.message_parts
-          : Array.isArray(compactedRecord?.message_parts)
-            ? compactedRecord.message_parts
-            : [];
+  const emittedParts = asRecord(record?.emitted)?.message_parts;
+  const recordParts = record?.message_parts;
+  const taskParts = asRecord(compactedRecord?.task)?.message_parts;
+  const compactedParts = compactedRecord?.message_parts;
+  const rawMessageParts: unknown[] = Array.isArray(emittedParts)
+    ? emittedParts
+    : Array.isArray(recordParts)
+      ? recordParts
+      : Array.isArray(taskParts)
+        ? taskParts
+        : Array.isArray(compactedParts)
+          ? compactedParts
+          : [];
 
   const imageArtifacts = options.includeImageContent
     ? await buildInternalToolImageArtifacts(runtime, rawMessageParts)
     : [];
-  if (Array.isArray(rawMessageParts) && imageArtifacts.length > 0) {
-    for (const part of rawMessageParts) {
-      const record = asRecord(part);
-      if (!record) {
-        continue;
-      }
-      const attachmentId =
-        typeof record.attachment_id === "string" ? record.attachment_id : null;
-      const matched = imageArtifacts.find((item) => item.attachmentId === attachmentId);
-      if (matched?.localPath) {
-        record.local_path = matched.localPath;
+  let messageParts = rawMessageParts;
+  if (imageArtifacts.length > 0) {
+    const localPaths = new Map<string | null, string | null>();
+    for (const artifact of imageArtifacts) {
+      if (!localPaths.has(artifact.attachmentId)) {
+        localPaths.set(artifact.attachmentId, artifact.localPath);
       }
     }
+    messageParts = rawMessageParts.map((part) => {
+      const partRecord = asRecord(part);
+      if (!partRecord) {
+        return part;
+      }
+      const attachmentId =
+        typeof partRecord.attachment_id === "string" ? partRecord.attachment_id : null;
+      const localPath = localPaths.get(attachmentId);
+      return localPath ? { ...partRecord, local_path: localPath } : part;
+    });
   }
 
-  const finalValue = asRecord(compacted)
+  const finalValue = compactedRecord
     ? compactObject({
         ...compactedRecord,
         logs: options.includeLogs && compactLogs.length > 0 ? compactLogs : null,
         message_parts:
-          Array.isArray(rawMessageParts) && rawMessageParts.length > 0
-            ? compactInternalToolMessageParts(rawMessageParts)
-            : compactedRecord?.message_parts,
+          messageParts.length > 0
+            ? compactInternalToolMessageParts(messageParts)
+            : compactedRecord.message_parts,
       })
     : compacted;
 
@@ -535,9 +601,9 @@ async function waitForInternalToolTask(
     pollIntervalSeconds: number;
   },
 ) {
-  const deadline = Date.now() + options.waitTimeoutSeconds * 1000;
+  const deadline = performance.now() + options.waitTimeoutSeconds * 1000;
   let latest = await runtime.gateway.request("GET", `/tools/tasks/${encodeSegment(taskId)}`);
-  while (Date.now() < deadline) {
+  while (performance.now() < deadline) {
     const statusRecord = asRecord(latest);
     const status =
       typeof statusRecord?.status === "string" ? statusRecord.status.trim() : null;
@@ -556,7 +622,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
   registerMessageTools(registrar);
   registerPluginTools(registrar);
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "list_platforms",
@@ -566,8 +632,8 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["platform", "adapter"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/platforms"),
+    "/platforms",
+    { cacheTtlMs: 30_000 },
   );
 
   withToolErrorBoundary(
@@ -585,13 +651,15 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       history_offset_sec: z.number().int().min(60).max(7 * 24 * 3600).default(86400),
     },
     async ({ include_history, history_offset_sec }) => {
-      const live = await runtime.gateway.request("GET", "/platforms/stats");
       if (!include_history) {
-        return { live };
+        return { live: await runtime.gateway.request("GET", "/platforms/stats") };
       }
-      const history = await runtime.gateway.request("GET", "/platforms/stats/history", {
-        query: { offset_sec: history_offset_sec },
-      });
+      const [live, history] = await Promise.all([
+        runtime.gateway.request("GET", "/platforms/stats"),
+        runtime.gateway.request("GET", "/platforms/stats/history", {
+          query: { offset_sec: history_offset_sec },
+        }),
+      ]);
       return { live, history };
     },
   );
@@ -613,7 +681,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       runtime.gateway.request("GET", `/platforms/${encodeSegment(platform_id)}`),
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "list_providers",
@@ -623,11 +691,10 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["provider", "model-provider"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/providers"),
+    "/providers",
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "get_current_provider",
@@ -637,8 +704,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["current-provider"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/providers/current"),
+    "/providers/current",
   );
 
   withToolErrorBoundary(
@@ -656,14 +722,16 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
     },
     async ({ provider_id }) => {
       const candidates = new Set<string>([provider_id]);
-      if (provider_id.includes("/")) {
-        candidates.add(provider_id.split("/")[0] ?? provider_id);
+      const slashIndex = provider_id.indexOf("/");
+      const providerPrefix = slashIndex >= 0 ? provider_id.slice(0, slashIndex) : provider_id;
+      if (slashIndex >= 0) {
+        candidates.add(providerPrefix);
       }
+      const normalizedPrefix = providerPrefix.replace(PROVIDER_SOURCE_SUFFIX_PATTERN, "");
 
       try {
         const providers = await runtime.gateway.request("GET", "/providers");
         const items = Array.isArray(providers) ? providers : [];
-        const providerPrefix = provider_id.includes("/") ? provider_id.split("/")[0] ?? provider_id : provider_id;
         for (const item of items) {
           if (typeof item !== "object" || !item) {
             continue;
@@ -680,10 +748,14 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
             config && typeof config.provider_source_id === "string"
               ? config.provider_source_id
               : null;
-          const normalizedSourceId = sourceId ? sourceId.replace(/[（(].*?[)）]/g, "") : null;
-          const normalizedPrefix = providerPrefix.replace(/[（(].*?[)）]/g, "");
-
-          if ([id, itemProviderId, config?.id].includes(provider_id) && sourceId) {
+          const normalizedSourceId = sourceId
+            ? sourceId.replace(PROVIDER_SOURCE_SUFFIX_PATTERN, "")
+            : null;
+
+          if (
+            (id === provider_id || itemProviderId === provider_id || config?.id === provider_id) &&
+            sourceId
+          ) {
             if (id) {
               candidates.add(id);
             }
@@ -765,6 +837,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       value_query: z.string().optional(),
       case_sensitive: z.boolean().default(false),
       max_results: z.number().int().min(1).max(200).default(30),
+      max_depth: z.number().int().min(1).max(64).default(32).describe("Maximum path depth to search. Deeper config nodes are skipped."),
     },
     async ({
       scope,
@@ -773,10 +846,13 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       value_query,
       case_sensitive,
       max_results,
+      max_depth,
     }) => {
       let snapshot: unknown;
       if (scope === "core") {
-        snapshot = await runtime.gateway.request("GET", "/configs/core");
+        snapshot = await runtime.gateway.request("GET", "/configs/core", {
+          cacheTtlMs: SEARCH_CONFIG_CACHE_TTL_MS,
+        });
       } else {
         if (!plugin_name) {
           throw new Error("plugin_name is required when scope is plugin.");
@@ -784,17 +860,20 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
         snapshot = await runtime.gateway.request(
           "GET",
           `/configs/plugins/${encodeSegment(plugin_name)}`,
+          { cacheTtlMs: SEARCH_CONFIG_CACHE_TTL_MS },
         );
       }
       const sanitized = redactSensitiveData(snapshot);
       return {
         scope,
         plugin_name: plugin_name ?? null,
+        max_depth,
         results: searchObject(sanitized, {
           keyQuery: key_query,
           valueQuery: value_query ?? null,
           caseSensitive: case_sensitive,
           maxResults: max_results,
+          maxDepth: max_depth,
         }),
       };
     },
@@ -1034,7 +1113,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
     registrar,
     {
       name: "stream_internal_tool_task",
-      summary: "Watch one internal tool task SSE stream and return compact events.",
+      summary: `Watch one internal tool task SSE stream and return compact events. At most ${STREAM_MAX_EVENTS} events are returned; \`truncated\` is set when the stream was cut off at that limit.`,
       category: "astrbot_tools",
       minMode: "readonly",
       risk: "read",
@@ -1062,42 +1141,34 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       show_arguments,
       show_debug,
     }) => {
-      const events = await runtime.gateway.stream(
-        "GET",
-        `/tools/tasks/${encodeSegment(task_id)}/stream`,
-        {
+      const compactOptions = {
+        includeParameters: show_parameters,
+        includeArguments: show_arguments,
+        includeDebug: show_debug,
+      };
+      const { events, truncated } = await collectInternalToolTaskEvents(
+        runtime.gateway.events("GET", `/tools/tasks/${encodeSegment(task_id)}/stream`, {
           query: { replay_history },
           timeoutMs: Math.max(1000, wait_seconds * 1000),
-        },
+        }),
+        compactOptions,
       );
       const snapshot = await runtime.gateway.request(
         "GET",
         `/tools/tasks/${encodeSegment(task_id)}`,
       );
-      const task = compactInternalToolInvocation(snapshot, {
-        includeParameters: show_parameters,
-        includeArguments: show_arguments,
-        includeDebug: show_debug,
-      });
+      const snapshotRecord = asRecord(snapshot);
+      const task = compactInternalToolInvocation(snapshot, compactOptions);
       const payload = compactObject({
-        task: compactInternalToolInvocation(snapshot, {
-          includeParameters: show_parameters,
-          includeArguments: show_arguments,
-          includeDebug: show_debug,
-        }),
-        events: events
-          .map((event) => compactInternalToolTaskEvent(event.data, {
-            includeParameters: show_parameters,
-            includeArguments: show_arguments,
-            includeDebug: show_debug,
-          }))
-          .filter((event) => event !== null && event !== undefined),
+        task,
+        events,
+        truncated: truncated ? true : null,
       });
       return await buildInternalToolRichResult(
         runtime,
         compactObject({
-          ...(asRecord(snapshot) ?? {}),
-          logs: include_logs ? asRecord(snapshot)?.logs : null,
+          ...snapshotRecord,
+          logs: include_logs ? snapshotRecord?.logs : null,
           message_parts: asRecord(task)?.message_parts,
         }),
         payload,
@@ -1110,7 +1181,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
     },
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "list_mcp_servers",
@@ -1120,8 +1191,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["mcp-list"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/tools/mcp/servers"),
+    "/tools/mcp/servers",
   );
 
   withToolErrorBoundary(
@@ -1204,7 +1274,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       }),
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "list_personas",
@@ -1214,8 +1284,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["persona-list"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/personas"),
+    "/personas",
   );
 
   withToolErrorBoundary(
@@ -1338,7 +1407,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       runtime.gateway.request("DELETE", `/personas/${encodeSegment(persona_id)}`),
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "list_skills",
@@ -1348,8 +1417,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["skill-list"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/skills"),
+    "/skills",
   );
 
   withToolErrorBoundary(
@@ -1366,7 +1434,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       zip_path: z.string().min(1),
     },
     async ({ zip_path }) => {
-      if (!existsSync(zip_path)) {
+      if (!(await pathExists(zip_path))) {
         throw new Error(`Skill zip not found: ${zip_path}`);
       }
       return runtime.gateway.uploadFile("/skills/upload", zip_path);
@@ -1410,7 +1478,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       runtime.gateway.request("DELETE", `/skills/${encodeSegment(skill_name)}`),
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "list_subagents",
@@ -1420,11 +1488,10 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["subagent-list"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/subagents"),
+    "/subagents",
   );
 
-  withToolErrorBoundary(
+  registerGatewayRead(
     registrar,
     {
       name: "inspect_subagent_config",
@@ -1434,8 +1501,7 @@ export function registerTools(server: McpServer, runtime: Runtime): ToolCatalogE
       risk: "read",
       aliases: ["subagent-config"],
     },
-    {},
-    async () => runtime.gateway.request("GET", "/subagents/config"),
+    "/subagents/config",
   );
 
   withToolErrorBoundary(
@@ -1,3 +1,5 @@
+import { access } from "node:fs/promises";
+
 export function ensureRecord(value: unknown, message: string): Record<string, unknown> {
   if (!value || typeof value !== "object" || Array.isArray(value)) {
     throw new Error(message);
@@ -17,6 +19,15 @@ export function includesInsensitive(haystack: string, needle: string): boolean {
   return haystack.toLowerCase().includes(needle.toLowerCase());
 }
 
+export async function pathExists(path: string): Promise<boolean> {
+  try {
+    await access(path);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
 export function truncate(value: string, maxLength: number): string {
   if (value.length <= maxLength) {
     return value;
@@ -24,10 +35,11 @@ export function truncate(value: string, maxLength: number): string {
   return `${value.slice(0, Math.max(0, maxLength - 1))}…`;
 }
 
+const SENSITIVE_KEY_PATTERN =
+  /(token|secret|password|jwt|api[_-]?key|access[_-]?token|private[_-]?key|authorization|cookie|credential|auth_token|key$)/i;
+
 function isSensitiveKey(key: string): boolean {
-  return /(token|secret|password|jwt|api[_-]?key|access[_-]?token|private[_-]?key|authorization|cookie|credential|auth_token|key$)/i.test(
-    key,
-  );
+  return SENSITIVE_KEY_PATTERN.test(key);
 }
 
 export function redactSensitiveData<T>(value: T): T {
@@ -62,60 +74,91 @@ export interface SearchConfigOptions {
   valueQuery?: string | null;
   caseSensitive?: boolean;
   maxResults?: number;
+  // Maximum number of segments in a reported path; deeper containers are skipped.
+  maxDepth?: number;
+}
+
+const PREVIEW_VALUE_TYPES = new Set(["string", "number", "boolean"]);
+
+function keepCase(text: string): string {
+  return text;
+}
+
+function lowerCase(text: string): string {
+  return text.toLowerCase();
+}
+
+interface SearchFrame {
+  container: unknown[] | Record<string, unknown>;
+  keys: string[] | null;
+  // Dotted path of this container including the trailing ".", or "" at the root.
+  prefix: string;
+  depth: number;
+  next: number;
 }
 
 export function searchObject(
   root: unknown,
   options: SearchConfigOptions,
 ): SearchMatch[] {
-  const keyQuery = options.caseSensitive
-    ? options.keyQuery
-    : options.keyQuery.toLowerCase();
-  const valueQuery = options.valueQuery
-    ? options.caseSensitive
-      ? options.valueQuery
-      : options.valueQuery.toLowerCase()
-    : null;
+  const fold = options.caseSensitive ? keepCase : lowerCase;
+  const keyQuery = fold(options.keyQuery);
+  const valueQuery = options.valueQuery ? fold(options.valueQuery) : null;
   const maxResults = options.maxResults ?? 30;
+  const maxDepth = options.maxDepth ?? 32;
   const results: SearchMatch[] = [];
+  if (maxResults <= 0) {
+    return results;
+  }
 
-  const visit = (value: unknown, path: string[]) => {
-    if (results.length >= maxResults) {
+  const stack: SearchFrame[] = [];
+  const pushFrame = (value: unknown, parent: SearchFrame | null, segment?: string | number) => {
+    const depth = parent ? parent.depth + 1 : 0;
+    if (!value || typeof value !== "object" || depth >= maxDepth) {
       return;
     }
+    const prefix = parent ? `${parent.prefix}${segment}.` : "";
     if (Array.isArray(value)) {
-      value.forEach((item, index) => visit(item, [...path, String(index)]));
-      return;
+      stack.push({ container: value, keys: null, prefix, depth, next: 0 });
+    } else {
+      const container = value as Record<string, unknown>;
+      stack.push({ container, keys: Object.keys(container), prefix, depth, next: 0 });
     }
-    if (value && typeof value === "object") {
-      for (const [key, item] of Object.entries(value as Record<string, unknown>)) {
-        const keyTarget = options.caseSensitive ? key : key.toLowerCase();
-        let matched = keyTarget.includes(keyQuery);
-        const previewSource =
-          item === null || ["string", "number", "boolean"].includes(typeof item)
-            ? String(item)
-            : "";
-        if (matched && valueQuery) {
-          const previewTarget = options.caseSensitive
-            ? previewSource
-            : previewSource.toLowerCase();
-          matched = previewTarget.includes(valueQuery);
-        }
-        if (matched) {
-          results.push({
-            path: [...path, key].join("."),
-            key,
-            valuePreview: truncate(previewSource, 180),
-          });
-          if (results.length >= maxResults) {
-            return;
-          }
+  };
+
+  pushFrame(root, null);
+  while (stack.length > 0) {
+    const frame = stack[stack.length - 1];
+    const { keys } = frame;
+    const size = keys ? keys.length : (frame.container as unknown[]).length;
+    if (frame.next >= size) {
+      stack.pop();
+      continue;
+    }
+    const index = frame.next++;
+
+    if (!keys) {
+      pushFrame((frame.container as unknown[])[index], frame, index);
+      continue;
+    }
+
+    const key = keys[index];
+    const item = (frame.container as Record<string, unknown>)[key];
+    if (fold(key).includes(keyQuery)) {
+      const previewSource =
+        item === null || PREVIEW_VALUE_TYPES.has(typeof item) ? String(item) : "";
+      if (!valueQuery || fold(previewSource).includes(valueQuery)) {
+        results.push({
+          path: frame.prefix + key,
+          key,
+          valuePreview: truncate(previewSource, 180),
+        });
+        if (results.length >= maxResults) {
+          return results;
         }
-        visit(item, [...path, key]);
       }
     }
-  };
-
-  visit(root, []);
+    pushFrame(item, frame, key);
+  }
   return results;
 }
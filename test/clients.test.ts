@@ -0,0 +1,210 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+import { createServer } from "node:http";
+import type { RequestListener } from "node:http";
+import { mkdtemp, writeFile } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
+import type { AddressInfo } from "node:net";
+
+import { GatewayClient, SseParser } from "../src/clients.js";
+
+function createClient(port: number) {
+  return new GatewayClient({
+    gatewayUrl: `http://127.0.0.1:${port}`,
+    gatewayToken: "test-token",
+    gatewayTimeout: 5000,
+    capabilityMode: "full",
+    enableSearchTools: false,
+    logView: "compact",
+    enableLogNoiseFiltering: true,
+    githubAcceleration: null,
+  });
+}
+
+async function withGatewayServer(
+  handler: RequestListener,
+  run: (client: GatewayClient) => Promise<void>,
+) {
+  const server = createServer(handler);
+  await new Promise<void>((resolve) => server.listen(0, "127.0.0.1", resolve));
+  const { port } = server.address() as AddressInfo;
+  try {
+    await run(createClient(port));
+  } finally {
+    server.closeAllConnections();
+    await new Promise((resolve) => server.close(resolve));
+  }
+}
+
+test("SseParser emits events split across chunks and CRLF boundaries", () => {
+  const parser = new SseParser();
+
+  assert.deepEqual(parser.push('id: 1\r\ndata: {"type":"acc'), []);
+  assert.deepEqual(parser.push('epted"}\r'), []);
+  assert.deepEqual(parser.push("\n\r\nevent: emitted\ndata: first\ndata: second\n\n"), [
+    { id: "1", event: undefined, data: { type: "accepted" } },
+    { id: undefined, event: "emitted", data: "first\nsecond" },
+  ]);
+  assert.deepEqual(parser.push(": keep-alive\n\ndata: tail"), []);
+  assert.deepEqual(parser.flush(), { id: undefined, event: undefined, data: "tail" });
+});
+
+test("GatewayClient.events releases the stream when the consumer stops early", async () => {
+  let closed = false;
+  await withGatewayServer(
+    (req, res) => {
+      res.writeHead(200, { "Content-Type": "text/event-stream" });
+      let sequence = 0;
+      const timer = setInterval(() => {
+        sequence += 1;
+        res.write(`data: {"seq":${sequence}}\n\n`);
+      }, 5);
+      req.on("close", () => {
+        closed = true;
+        clearInterval(timer);
+      });
+    },
+    async (client) => {
+      const events: unknown[] = [];
+      for await (const event of client.events("GET", "/tools/tasks/t1/stream")) {
+        events.push(event.data);
+        if (events.length >= 3) {
+          break;
+        }
+      }
+
+      assert.deepEqual(events, [{ seq: 1 }, { seq: 2 }, { seq: 3 }]);
+      await new Promise((resolve) => setTimeout(resolve, 50));
+      assert.equal(closed, true);
+    },
+  );
+});
+
+test("GatewayClient.request shares one round-trip between identical concurrent GETs", async () => {
+  let hits = 0;
+  await withGatewayServer(
+    (_req, res) => {
+      hits += 1;
+      setTimeout(() => {
+        res.writeHead(200, { "Content-Type": "application/json" });
+        res.end(JSON.stringify({ ok: true, data: { hits } }));
+      }, 20);
+    },
+    async (client) => {
+      const [first, second, other] = await Promise.all([
+        client.request("GET", "/platforms"),
+        client.request("GET", "/platforms"),
+        client.request("GET", "/platforms", { query: { page: 2 } }),
+      ]);
+      assert.equal(first, second);
+      assert.notEqual(first, other);
+      assert.equal(hits, 2);
+
+      await client.request("GET", "/platforms");
+      assert.equal(hits, 3);
+    },
+  );
+});
+
+test("GatewayClient.request does not join a GET that started before a write", async () => {
+  let hits = 0;
+  await withGatewayServer(
+    (req, res) => {
+      hits += 1;
+      const current = hits;
+      setTimeout(
+        () => {
+          res.writeHead(200, { "Content-Type": "application/json" });
+          res.end(JSON.stringify({ ok: true, data: { hits: current } }));
+        },
+        req.method === "GET" ? 30 : 0,
+      );
+    },
+    async (client) => {
+      const before = client.request("GET", "/plugins");
+      await client.request("POST", "/plugins/demo/reload");
+      const after = client.request("GET", "/plugins");
+
+      assert.notDeepEqual(await after, await before);
+      assert.equal(hits, 3);
+    },
+  );
+});
+
+test("GatewayClient.request serves cached GETs until a write clears them", async () => {
+  let hits = 0;
+  await withGatewayServer(
+    (_req, res) => {
+      hits += 1;
+      res.writeHead(200, { "Content-Type": "application/json" });
+      res.end(JSON.stringify({ ok: true, data: { hits } }));
+    },
+    async (client) => {
+      assert.deepEqual(await client.request("GET", "/plugins", { cacheTtlMs: 60_000 }), { hits: 1 });
+      assert.deepEqual(await client.request("GET", "/plugins", { cacheTtlMs: 60_000 }), { hits: 1 });
+
+      assert.deepEqual(await client.request("GET", "/plugins"), { hits: 2 });
+
+      await client.request("POST", "/plugins/demo/reload");
+      assert.deepEqual(await client.request("GET", "/plugins", { cacheTtlMs: 60_000 }), { hits: 4 });
+    },
+  );
+});
+
+test("GatewayClient.request does not cache a GET that overlapped a write", async () => {
+  let hits = 0;
+  await withGatewayServer(
+    (req, res) => {
+      hits += 1;
+      const current = hits;
+      setTimeout(
+        () => {
+          res.writeHead(200, { "Content-Type": "application/json" });
+          res.end(JSON.stringify({ ok: true, data: { hits: current } }));
+        },
+        req.method === "GET" ? 30 : 0,
+      );
+    },
+    async (client) => {
+      const stale = client.request("GET", "/platforms", { cacheTtlMs: 60_000 });
+      await client.request("POST", "/plugins/demo/reload");
+      const staleValue = await stale;
+
+      const fresh = await client.request("GET", "/platforms", { cacheTtlMs: 60_000 });
+      assert.notDeepEqual(fresh, staleValue);
+      assert.equal(hits, 3);
+    },
+  );
+});
+
+test("GatewayClient.uploadFile streams the file as a typed multipart part", async () => {
+  const dir = await mkdtemp(join(tmpdir(), "astrbot-mcp-upload-"));
+  const zipPath = join(dir, "demo-plugin.zip");
+  await writeFile(zipPath, "zip-bytes");
+
+  let received: { name: string; type: string; text: string } | null = null;
+  await withGatewayServer(
+    async (req, res) => {
+      const form = await new Request(`http://local${req.url}`, {
+        method: "POST",
+        headers: req.headers as Record<string, string>,
+        body: req as unknown as BodyInit,
+        duplex: "half",
+      } as RequestInit).formData();
+      const file = form.get("file") as File;
+      received = { name: file.name, type: file.type, text: await file.text() };
+      res.writeHead(200, { "Content-Type": "application/json" });
+      res.end(JSON.stringify({ ok: true, data: { uploaded: true } }));
+    },
+    async (client) => {
+      const result = await client.uploadFile("/plugins/install/upload", zipPath);
+      assert.deepEqual(result, { uploaded: true });
+      assert.deepEqual(received, {
+        name: "demo-plugin.zip",
+        type: "application/zip",
+        text: "zip-bytes",
+      });
+    },
+  );
+});
@@ -42,3 +42,22 @@ test("loadConfig uses gateway-only defaults", () => {
     }
   }
 });
+
+test("loadConfig validates GitHub acceleration at startup", () => {
+  const base = { ASTRBOT_GATEWAY_TOKEN: "test-token" };
+
+  assert.equal(
+    loadConfig({ ...base, ASTRBOT_GITHUB_ACCELERATION: "https://gh-proxy.com/" }).githubAcceleration,
+    "https://gh-proxy.com",
+  );
+  assert.equal(
+    loadConfig({ ...base, ASTRBOT_GITHUB_ACCELERATION: "Disabled" }).githubAcceleration,
+    "Disabled",
+  );
+  assert.equal(loadConfig(base).githubAcceleration, null);
+  assert.equal(Object.isFrozen(loadConfig(base)), true);
+  assert.throws(
+    () => loadConfig({ ...base, ASTRBOT_GITHUB_ACCELERATION: "gh-proxy.com" }),
+    /ASTRBOT_GITHUB_ACCELERATION must be/,
+  );
+});
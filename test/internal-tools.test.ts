@@ -2,6 +2,7 @@ import test from "node:test";
 import assert from "node:assert/strict";
 
 import {
+  collectInternalToolTaskEvents,
   compactInternalTool,
   compactInternalToolInvocation,
   compactInternalToolList,
@@ -308,3 +309,34 @@ test("compactInternalToolInvocation can include parameters and arguments when re
     },
   });
 });
+
+async function* taskEvents(types: string[]) {
+  for (const [index, type] of types.entries()) {
+    yield { id: undefined, event: undefined, data: { seq: index + 1, type } };
+  }
+}
+
+test("collectInternalToolTaskEvents stops at the terminal event", async () => {
+  const result = await collectInternalToolTaskEvents(
+    taskEvents(["accepted", "emitted", "completed", "emitted"]),
+  );
+
+  assert.deepEqual(
+    result.events.map((event) => (event as { type: string }).type),
+    ["accepted", "emitted", "completed"],
+  );
+  assert.equal(result.truncated, false);
+});
+
+test("collectInternalToolTaskEvents reports truncation at maxEvents", async () => {
+  const result = await collectInternalToolTaskEvents(
+    taskEvents(["accepted", "emitted", "emitted", "completed"]),
+    { maxEvents: 2 },
+  );
+
+  assert.deepEqual(
+    result.events.map((event) => (event as { seq: number }).seq),
+    [1, 2],
+  );
+  assert.equal(result.truncated, true);
+});
@@ -1,7 +1,7 @@
 import test from "node:test";
 import assert from "node:assert/strict";
 
-import { extractLogEntries, filterLogsByContains } from "../src/logs.js";
+import { compactLogs, extractLogEntries, filterLogsByContains } from "../src/logs.js";
 
 test("extractLogEntries supports nested gateway payload shapes", () => {
   const payload = {
@@ -41,3 +41,24 @@ test("filterLogsByContains narrows logs to matching entries", () => {
 
   assert.deepEqual(result, [{ level: "INFO", data: "plugin_b handled request" }]);
 });
+
+test("compactLogs keeps the newest entries and collapses repeated runs", () => {
+  const rawLogs = [
+    { time: "1", level: "INFO", data: "boot" },
+    { time: "2", level: "INFO", data: "ready" },
+    { time: "3", level: "INFO", data: "ready" },
+    { time: "4", level: "DEBUG", data: "noise" },
+    { time: "5", level: "INFO", data: "ready" },
+    { time: "6", level: "INFO", data: "done" },
+  ];
+
+  const result = compactLogs(rawLogs, { enableNoiseFiltering: true, maxEntries: 2 });
+
+  assert.deepEqual(
+    result.map((entry) => [entry.time, entry.message]),
+    [
+      ["2", "ready"],
+      ["6", "done"],
+    ],
+  );
+});
@@ -27,6 +27,7 @@ function createRuntime(handler: (waitSeconds: number) => unknown): Runtime {
       enableSearchTools: false,
       logView: "compact",
       enableLogNoiseFiltering: true,
+      githubAcceleration: null,
     },
     hints: testHints,
     gateway: {
@@ -55,10 +56,10 @@ test("waitForEventToSettle returns immediate logs when waiting is disabled", asy
 });
 
 test("waitForEventToSettle waits until event logs become quiet", async () => {
-  const originalNow = Date.now;
+  const originalNow = performance.now;
   let nowMs = 1_000_000;
   let callCount = 0;
-  Date.now = () => nowMs;
+  performance.now = () => nowMs;
 
   try {
     const runtime = createRuntime((waitSeconds) => {
@@ -82,15 +83,15 @@ test("waitForEventToSettle waits until event logs become quiet", async () => {
     assert.equal(result.waitedSeconds, 2);
     assert.equal(callCount, 2);
   } finally {
-    Date.now = originalNow;
+    performance.now = originalNow;
   }
 });
 
 test("waitForEventToSettle times out when logs keep changing", async () => {
-  const originalNow = Date.now;
+  const originalNow = performance.now;
   let nowMs = 2_000_000;
   let seq = 0;
-  Date.now = () => nowMs;
+  performance.now = () => nowMs;
 
   try {
     const runtime = createRuntime((waitSeconds) => {
@@ -113,7 +114,7 @@ test("waitForEventToSettle times out when logs keep changing", async () => {
     assert.equal(result.checks, 2);
     assert.equal((result.logs.at(-1) as { message?: string })?.message, "reply chunk 2");
   } finally {
-    Date.now = originalNow;
+    performance.now = originalNow;
   }
 });
 
@@ -269,6 +270,7 @@ test("trigger fallback log parser can use prepare-to-send line shape", async ()
       enableSearchTools: false,
       logView: "compact",
       enableLogNoiseFiltering: true,
+      githubAcceleration: null,
     },
     hints: testHints,
     gateway: {
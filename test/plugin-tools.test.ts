@@ -129,6 +129,17 @@ test("resolveGitHubAcceleration supports explicit disable", async () => {
   assert.equal(result, "");
 });
 
+test("resolveGitHubAcceleration falls back to the configured default", async () => {
+  const result = await resolveGitHubAcceleration({
+    configured: "https://ghfast.top/",
+    probe: async () => {
+      throw new Error("probe should not run for configured override");
+    },
+  });
+
+  assert.equal(result, "https://ghfast.top");
+});
+
 test("resolveGitHubAcceleration auto-selects first reachable candidate", async () => {
   const probed: string[] = [];
   const result = await resolveGitHubAcceleration({
@@ -0,0 +1,80 @@
+import test from "node:test";
+import assert from "node:assert/strict";
+
+import { searchObject } from "../src/utils.js";
+
+test("searchObject walks nested objects and arrays in document order", () => {
+  const config = {
+    platform: [
+      { id: "qq", type: "aiocqhttp" },
+      { id: "web", nested: { uid: 3 } },
+    ],
+    admins_id: ["1"],
+  };
+
+  const result = searchObject(config, { keyQuery: "id" });
+
+  assert.deepEqual(result, [
+    { path: "platform.0.id", key: "id", valuePreview: "qq" },
+    { path: "platform.1.id", key: "id", valuePreview: "web" },
+    { path: "platform.1.nested.uid", key: "uid", valuePreview: "3" },
+    { path: "admins_id", key: "admins_id", valuePreview: "" },
+  ]);
+});
+
+test("searchObject applies value queries and case sensitivity", () => {
+  const config = {
+    Model: "GPT-4o",
+    model_list: ["gpt"],
+    other: { model: "claude", enabled: false },
+  };
+
+  assert.deepEqual(
+    searchObject(config, { keyQuery: "MODEL", valueQuery: "gpt" }).map((item) => item.path),
+    ["Model"],
+  );
+  assert.deepEqual(
+    searchObject(config, { keyQuery: "model", caseSensitive: true }).map((item) => item.path),
+    ["model_list", "other.model"],
+  );
+});
+
+test("searchObject stops at maxResults", () => {
+  const config = { a_key: 1, b_key: { c_key: 2 }, d_key: 3 };
+
+  const result = searchObject(config, { keyQuery: "key", maxResults: 2 });
+
+  assert.deepEqual(
+    result.map((item) => item.path),
+    ["a_key", "b_key"],
+  );
+});
+
+test("searchObject stops walking outer entries once maxResults is reached", () => {
+  const config = {
+    nested: { a_key: 1 },
+    get b_key(): number {
+      throw new Error("searchObject read past maxResults");
+    },
+  };
+
+  const result = searchObject(config, { keyQuery: "a_key", maxResults: 1 });
+
+  assert.deepEqual(
+    result.map((item) => item.path),
+    ["nested.a_key"],
+  );
+});
+
+test("searchObject skips containers deeper than maxDepth", () => {
+  const config = { a: { b: { c_key: 1 }, c_key: 2 }, c_key: 3 };
+
+  assert.deepEqual(
+    searchObject(config, { keyQuery: "c_key", maxDepth: 2 }).map((item) => item.path),
+    ["a.c_key", "c_key"],
+  );
+  assert.deepEqual(
+    searchObject(config, { keyQuery: "c_key" }).map((item) => item.path),
+    ["a.b.c_key", "a.c_key", "c_key"],
+  );
+});